@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fetch_banner_store_news import classify_entry  # noqa: E402
+
+
+# Headlines in the shape Google News returns them; the RSS <description> is
+# just the title plus the publisher, so the summary rarely adds a signal.
+CLOSING_HEADLINES = [
+    "Walmart closes store in Portland, citing underperformance",
+    "Kroger to shutter three stores in Indiana",
+    "Joann announces more store closings",
+    "Party City closings list: See which stores are shutting down",
+    "Big Lots liquidations begin at remaining locations",
+    "Rite Aid to close all remaining stores",
+    "Walgreens closing more stores: Here's the list",
+    "Bed Bath & Beyond going-out-of-business sales begin",
+    "Family Dollar shuts down 50 locations across the Southeast",
+    "Conn's ceases operations after bankruptcy filing",
+    "Last day for Joann at Westgate Mall",
+    "Target closes two stores, opens three new locations",
+]
+
+OPENING_HEADLINES = [
+    "Last day to apply for jobs ahead of Aldi grand opening",
+    "Aldi opens new store in Cedar Rapids",
+    "Trader Joe's coming soon to downtown Raleigh",
+    "Publix breaks ground on new Tallahassee supermarket",
+    "Costco closing on land for new warehouse in Texas",
+    "Walmart opens new store after closing old Supercenter",
+    "H-E-B signs lease for Austin location, construction begins this fall",
+    "Bank foreclosures rise as regional lenders tighten",
+    "Enclosing the patio: Starbucks remodel wraps up",
+]
+
+
+@pytest.mark.parametrize("title", CLOSING_HEADLINES)
+def test_closing_headlines(title):
+    assert classify_entry(title, f"{title}  The Local News") == 'Closing'
+
+
+@pytest.mark.parametrize("title", OPENING_HEADLINES)
+def test_opening_headlines(title):
+    assert classify_entry(title, f"{title}  The Local News") == 'Opening'
+
+
+def test_summary_used_when_title_has_no_signal():
+    assert classify_entry("Update on the Eastgate Kroger", "The store will close in May") == 'Closing'